@@ -22,6 +22,15 @@ class Command(StrEnum):
     QUIT = "quit"  # Exit interactive loop (not a state transition)
 
 
+# Command-line spellings (full names and shortcuts) for each command
+_ALIASES: dict[str, Command] = {
+    **{command.value: command for command in Command},
+    "n": Command.NEXT,
+    "f": Command.FINISH,
+    "q": Command.QUIT,
+}
+
+
 class GameMessage(BaseModel):
     """Envelope for messages that trigger transitions."""
 
@@ -95,16 +104,14 @@ async def stdin_reader(machine: WerewolfMachine) -> None:
         except (EOFError, KeyboardInterrupt):
             line = "quit"
 
-        cmd = line.strip().lower()
-        if cmd in {Command.NEXT.value, "n"}:
-            await machine.handle_message(GameMessage(command=Command.NEXT))
-        elif cmd in {Command.FINISH.value, "f"}:
-            await machine.handle_message(GameMessage(command=Command.FINISH))
-        elif cmd in {Command.QUIT.value, "q"}:
-            await machine.handle_message(GameMessage(command=Command.QUIT))
-            break
-        else:
+        command = _ALIASES.get(line.strip().lower())
+        if command is None:
             print("Unknown command. Use: next|n | finish|f | quit|q")
+            continue
+
+        await machine.handle_message(GameMessage(command=command))
+        if command is Command.QUIT:
+            break
 
         if machine.current_state.final:
             print("SM: finished; exiting.")